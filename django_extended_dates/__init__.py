@@ -1 +1,2 @@
 from .fields import ExtendedDateTimeField
+from .managers import ExtendedDateTimeManager, ExtendedDateTimeQuerySet
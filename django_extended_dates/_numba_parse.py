@@ -0,0 +1,146 @@
+"""
+Optional Numba-compiled batch parser for DB timestamp strings.
+
+Parses 'YYYY-MM-DD[ HH:MM:SS[.ffffff]]' AD strings and Postgres
+'YYYY-MM-DD HH:MM:SS[.ffffff] BC' strings straight from their ASCII bytes.
+Strings the kernel does not accept are flagged rather than rejected, so
+callers can fall back to the regular per-string parser (and its errors).
+Only used when numba is installed; see HAVE_NUMBA.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+from .utils import POW10, build_standard
+
+HAVE_NUMBA = njit is not None
+
+def _jit(func):
+    return njit(cache=True)(func) if HAVE_NUMBA else func
+
+_POW10 = np.array(POW10, dtype=np.int64)
+
+_MAX_YEAR_DIGITS = 9
+
+@_jit
+def _two_digits(buf, p):
+    # Value of the 2 ASCII digits at p, or -1
+    d1 = buf[p] - 48
+    d2 = buf[p + 1] - 48
+    if d1 < 0 or d1 > 9 or d2 < 0 or d2 > 9:
+        return -1
+    return d1 * 10 + d2
+
+@_jit
+def _parse_many(buf, starts, ends, pow10):
+    n = starts.shape[0]
+    years = np.zeros(n, np.int64)
+    months = np.zeros(n, np.int64)
+    days = np.zeros(n, np.int64)
+    hours = np.zeros(n, np.int64)
+    minutes = np.zeros(n, np.int64)
+    seconds = np.zeros(n, np.int64)
+    microseconds = np.zeros(n, np.int64)
+    ok = np.zeros(n, np.bool_)
+
+    for i in range(n):
+        a = starts[i]
+        b = ends[i]
+        # ' BC' suffix, case-insensitive (| 32 lowercases ASCII letters)
+        is_bc = (b - a >= 3 and buf[b - 3] == 32
+                 and (buf[b - 2] | 32) == 98 and (buf[b - 1] | 32) == 99)
+        if is_bc:
+            b -= 3
+
+        # Year: 4 to 9 digits; longer years would wrap int64, so they are
+        # left to the fallback parser
+        p = a
+        year = 0
+        while p < b and 48 <= buf[p] <= 57:
+            year = year * 10 + (buf[p] - 48)
+            p += 1
+        if p - a < 4 or p - a > _MAX_YEAR_DIGITS or year <= 0:
+            continue
+        if p + 6 > b or buf[p] != 45 or buf[p + 3] != 45:
+            continue
+        month = _two_digits(buf, p + 1)
+        day = _two_digits(buf, p + 4)
+        if month < 1 or month > 12 or day < 1 or day > 31:
+            continue
+
+        # Time: required for BC (space only), optional for AD (space or 'T')
+        q = p + 6
+        hour = minute = second = microsecond = 0
+        if q == b:
+            if is_bc:
+                continue
+        else:
+            if b - q < 9 or buf[q + 3] != 58 or buf[q + 6] != 58:
+                continue
+            if not (buf[q] == 32 or (buf[q] == 84 and not is_bc)):
+                continue
+            hour = _two_digits(buf, q + 1)
+            minute = _two_digits(buf, q + 4)
+            second = _two_digits(buf, q + 7)
+            if hour < 0 or hour > 23 or minute < 0 or minute > 59 or second < 0 or second > 59:
+                continue
+            r = q + 9
+            if r < b:
+                ndigits = b - r - 1
+                if buf[r] != 46 or ndigits < 1 or ndigits > 6:
+                    continue
+                valid = True
+                for k in range(r + 1, b):
+                    d = buf[k] - 48
+                    if d < 0 or d > 9:
+                        valid = False
+                        break
+                    microsecond = microsecond * 10 + d
+                if not valid:
+                    continue
+                microsecond *= pow10[6 - ndigits]
+
+        # Year YYYY BC -> cftime year -(YYYY-1)
+        years[i] = 1 - year if is_bc else year
+        months[i] = month
+        days[i] = day
+        hours[i] = hour
+        minutes[i] = minute
+        seconds[i] = second
+        microseconds[i] = microsecond
+        ok[i] = True
+
+    return years, months, days, hours, minutes, seconds, microseconds, ok
+
+def parse_fields(strings):
+    """
+    Parses a list of stripped DB strings into component arrays.
+    Returns (years, months, days, hours, minutes, seconds, microseconds, ok),
+    with cftime-style years and ok marking the strings that were parsed.
+    """
+    # 'replace' maps each non-ASCII character to one '?' byte, keeping the
+    # offsets aligned; the kernel then rejects those strings
+    buf = np.frombuffer(''.join(strings).encode('ascii', 'replace'), dtype=np.uint8)
+    lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+    ends = np.cumsum(lengths)
+    return _parse_many(buf, ends - lengths, ends, _POW10)
+
+def parse_many(strings):
+    """
+    Parses a list of stripped DB strings into cftime objects.
+    Entries the kernel could not parse (or that form an invalid date) are None.
+    """
+    *fields, ok = (array.tolist() for array in parse_fields(strings))
+    results = []
+    for components, parsed_ok in zip(zip(*fields), ok):
+        if parsed_ok:
+            try:
+                results.append(build_standard(*components))
+                continue
+            except (ValueError, OverflowError):
+                pass
+        results.append(None)
+    return results
@@ -3,7 +3,8 @@ from django.db import models
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 import datetime # Need this import
-import re # Import re for parsing
+import functools
+import numpy as np
 
 # Potentially helper functions for parsing/formatting PG strings
 # from .utils import parse_pg_timestamp_string, format_cftime_for_pg
@@ -11,6 +12,180 @@ import re # Import re for parsing
 # Import the form field and widget (needed for formfield method)
 # Ensure these imports are correct relative to your structure
 from .forms import ExtendedDateTimeFormField, ExtendedDateTimeInput
+from .utils import POW10, build_standard, to_display_year
+
+def _parse_pg_string(s):
+    """
+    Splits a Postgres 'YYYY-MM-DD HH:MM:SS[.ffffff][ BC]' string into
+    (is_bc, year, month, day, hour, minute, second, microsecond), with the
+    year as written (always positive). AD strings may also use a 'T'
+    separator or omit the time, matching the Numba batch kernel.
+    Raises ValueError if the string cannot be parsed.
+    """
+    is_bc = s[-2:].lower() == 'bc' and s[-3:-2].isspace()
+    if is_bc:
+        # Collapse whitespace runs, as the original '\s+' regex allowed them
+        # between date and time and before 'BC'
+        s = ' '.join(s[:-2].split())
+    elif s[4:5] == '-':
+        # 4-digit AD year: C-level parse, which also takes ISO variants such
+        # as a UTC offset. BC strings keep to the strict layout below.
+        try:
+            parsed_dt = datetime.datetime.fromisoformat(s)
+        except ValueError:
+            pass
+        else:
+            return (is_bc, parsed_dt.year, parsed_dt.month, parsed_dt.day,
+                    parsed_dt.hour, parsed_dt.minute, parsed_dt.second, parsed_dt.microsecond)
+
+    # Everything after the year sits at fixed offsets
+    y = s.find('-')
+    if y < 4 or len(s) < y + 6 or not s[:y].isdigit() or s[y + 3] != '-':
+        raise ValueError("Expected 'YYYY-MM-DD HH:MM:SS[.ffffff][ BC]' format")
+
+    microsecond = 0
+    if len(s) == y + 6 and not is_bc:
+        # Date only
+        parts = (s[y + 1:y + 3], s[y + 4:y + 6], '00', '00', '00')
+    else:
+        if (len(s) < y + 15 or s[y + 6] not in (' ' if is_bc else ' T')
+                or s[y + 9] != ':' or s[y + 12] != ':'):
+            raise ValueError("Expected 'YYYY-MM-DD HH:MM:SS[.ffffff][ BC]' format")
+        dot = s.find('.', y + 15)
+        if dot != -1:
+            microsecond_str = s[dot + 1:]
+            if dot != y + 15 or not microsecond_str.isdigit() or len(microsecond_str) > 6:
+                raise ValueError("Invalid fractional seconds")
+            microsecond = int(microsecond_str) * POW10[6 - len(microsecond_str)]
+        elif len(s) != y + 15:
+            raise ValueError("Unexpected trailing characters")
+        parts = (s[y + 1:y + 3], s[y + 4:y + 6], s[y + 7:y + 9], s[y + 10:y + 12], s[y + 13:y + 15])
+
+    # int() alone would accept a sign or padding spaces in the 2-digit fields
+    if not all(part.isdigit() for part in parts):
+        raise ValueError("Expected 'YYYY-MM-DD HH:MM:SS[.ffffff][ BC]' format")
+    month, day, hour, minute, second = map(int, parts)
+
+    year = int(s[:y])
+    if year <= 0:
+        raise ValueError("Year must be positive in DB string")
+    return (is_bc, year, month, day, hour, minute, second, microsecond)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_db_string(value_str):
+    """
+    Converts a stripped DB string ('YYYY-MM-DD HH:MM:SS[.ffffff][ BC]' or ISO AD)
+    to a cftime object. Memoized, as querysets often repeat the same timestamps.
+    """
+    try:
+        is_bc, year, month, day, hour, minute, second, microsecond = _parse_pg_string(value_str)
+    except ValueError as e:
+        if value_str[-2:].lower() == 'bc' and value_str[-3:-2].isspace():
+            raise ValidationError(f"Error creating cftime from DB string '{value_str}': {e}")
+        # Raise error for unexpected string formats if standard parsing fails
+        raise ValidationError(f"Unrecognized string format from DB for ExtendedDateTimeField: {value_str}")
+
+    try:
+        # Year YYYY BC -> cftime year -(YYYY-1): 1 BC -> 0, 2 BC -> -1, etc.
+        return build_standard(1 - year if is_bc else year, month, day,
+                              hour, minute, second, microsecond)
+    except (ValueError, OverflowError) as e:
+        raise ValidationError(f"Error creating cftime from DB string '{value_str}': {e}")
+
+def _identity(value):
+    return value
+
+def _db_string_to_cftime(value):
+    # Primarily expect 'YYYY-MM-DD HH:MM:SS BC' format from Postgres
+    return _parse_db_string(value.strip())
+
+def _db_datetime_to_cftime(value):
+    # Convert standard datetime to cftime, dropping tzinfo
+    try:
+         if not 1 <= value.year <= 9999:
+              raise ValidationError(f"Unexpected standard datetime year {value.year} from DB.")
+         return build_standard(value.year, value.month, value.day,
+                              value.hour, value.minute, value.second,
+                              value.microsecond)
+    except Exception as e:
+        raise ValidationError(f"Could not convert standard datetime {value} to cftime: {e}")
+
+def _string_to_cftime(value):
+    # Same string parsing as from_db_value, with a to_python error message
+    try:
+        return _parse_db_string(value.strip())
+    except ValidationError as e:
+         raise ValidationError(f"Invalid string format for to_python ('{value}'): {e}")
+
+def _datetime_to_cftime(value):
+    try:
+        return build_standard(value.year, value.month, value.day,
+                              value.hour, value.minute, value.second,
+                              value.microsecond)
+    except Exception as e:
+        raise ValidationError(f"Could not convert standard datetime {value} to cftime: {e}")
+
+def _date_to_cftime(value):
+    try:
+        return build_standard(value.year, value.month, value.day)
+    except Exception as e:
+        raise ValidationError(f"Could not convert standard date {value} to cftime: {e}")
+
+# Exact-type dispatch for the common cases; cftime returns calendar-specific
+# subclasses (DatetimeGregorian, ...), so register those alongside the base.
+_CFTIME_TYPES = (cftime.datetime, *cftime.datetime.__subclasses__())
+
+_FROM_DB_DISPATCH = {
+    str: _db_string_to_cftime,
+    datetime.datetime: _db_datetime_to_cftime,
+    type(None): _identity,
+    **{cls: _identity for cls in _CFTIME_TYPES},
+}
+
+_TO_PYTHON_DISPATCH = {
+    str: _string_to_cftime,
+    datetime.datetime: _datetime_to_cftime,
+    datetime.date: _date_to_cftime,
+    type(None): _identity,
+    **{cls: _identity for cls in _CFTIME_TYPES},
+}
+
+# cftime attributes returned by convert_column_arrays, in parse_fields order
+_COMPONENTS = ('year', 'month', 'day', 'hour', 'minute', 'second', 'microsecond')
+
+# Below this many values the Numba kernel's setup costs more than it saves
+_NUMBA_MIN_BATCH = 256
+
+@functools.lru_cache(maxsize=None)
+def _get_kernel():
+    """
+    Returns the _numba_parse module if numba is installed, else None.
+    Imported on first use so loading the field doesn't pull in numba.
+    """
+    from . import _numba_parse
+    return _numba_parse if _numba_parse.HAVE_NUMBA else None
+
+def _batch_kernel(n):
+    """
+    Returns the Numba kernel module for a batch of n values, or None when
+    numba is missing or the batch is too small to be worth it.
+    """
+    return _get_kernel() if n >= _NUMBA_MIN_BATCH else None
+
+def _parse_strings_batch(values):
+    """
+    Returns a list aligned with values holding the cftime objects parsed by
+    the Numba kernel, and None for entries left to the per-value handlers.
+    """
+    kernel = _batch_kernel(len(values))
+    if kernel is None:
+        return [None] * len(values)
+    indices = [i for i, value in enumerate(values) if type(value) is str]
+    results = [None] * len(values)
+    parsed = kernel.parse_many([values[i].strip() for i in indices])
+    for i, value in zip(indices, parsed):
+        results[i] = value
+    return results
 
 class ExtendedDateTimeField(models.DateTimeField):
     """
@@ -20,65 +195,24 @@ class ExtendedDateTimeField(models.DateTimeField):
     """
     description = _("Extended date and time")
 
-    def from_db_value(self, value, expression, connection):
+    def from_db_value(self, value, expression, connection,
+                      _cft=cftime.datetime, _dt=datetime.datetime):
         """
         Converts value from the database (expecting standard datetime or
         'YYYY-MM-DD HH:MM:SS BC' string) to a cftime object.
+        Dispatches on the exact type first; the _cft/_dt defaults bind the
+        types as locals for the isinstance fallback.
         """
-        if value is None:
-            return value
-        if isinstance(value, cftime.datetime):
+        handler = _FROM_DB_DISPATCH.get(type(value))
+        if handler is not None:
+            return handler(value)
+        # Subclasses of the dispatched types
+        if isinstance(value, _cft):
             return value
-        if isinstance(value, datetime.datetime):
-            # Convert standard datetime to cftime, dropping tzinfo
-            try:
-                 if not 1 <= value.year <= 9999:
-                      raise ValidationError(f"Unexpected standard datetime year {value.year} from DB.")
-                 return cftime.datetime(value.year, value.month, value.day,
-                                       value.hour, value.minute, value.second,
-                                       value.microsecond, calendar='standard')
-            except Exception as e:
-                raise ValidationError(f"Could not convert standard datetime {value} to cftime: {e}")
-
+        if isinstance(value, _dt):
+            return _db_datetime_to_cftime(value)
         if isinstance(value, str):
-            # Primarily expect 'YYYY-MM-DD HH:MM:SS BC' format from Postgres
-            value_str = value.strip()
-            # Regex allows for optional microseconds and case-insensitive 'BC'
-            bc_match = re.match(r"(\d{4,})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?\s+BC", value_str, re.IGNORECASE)
-
-            if bc_match:
-                 # Year YYYY BC -> cftime year -(YYYY-1)
-                year_str, month, day, hour, minute, second, microsecond_str = bc_match.groups()
-                year_int = int(year_str)
-                if year_int <= 0:
-                     raise ValueError("Year must be positive with BC suffix in DB string")
-                cftime_year = -(year_int - 1) # 1 BC -> 0, 2 BC -> -1, etc.
-
-                try:
-                    microsecond = int(microsecond_str.ljust(6, '0')) if microsecond_str else 0
-                    return cftime.datetime(cftime_year, int(month), int(day),
-                                           int(hour), int(minute), int(second),
-                                           microsecond, calendar='standard')
-                except Exception as e:
-                    raise ValidationError(f"Error creating cftime from DB string '{value_str}': {e}")
-            else:
-                 # If it's not BC format, maybe it's a standard ISO string AD date?
-                 # psycopg2 usually handles standard datetimes correctly.
-                 # We might need more robust parsing if other string formats are expected from DB.
-                 # For now, assume only standard datetime or BC format string.
-                 try:
-                     # Attempt parsing as standard datetime string (might be redundant if psycopg2 handles it)
-                     parsed_dt = datetime.datetime.fromisoformat(value_str)
-                     if 1 <= parsed_dt.year <= 9999:
-                          return cftime.datetime(parsed_dt.year, parsed_dt.month, parsed_dt.day,
-                                                parsed_dt.hour, parsed_dt.minute, parsed_dt.second,
-                                                parsed_dt.microsecond, calendar='standard')
-                     else:
-                          raise ValidationError("Parsed standard datetime year out of range.")
-                 except ValueError:
-                     # Raise error for unexpected string formats if standard parsing fails
-                    raise ValidationError(f"Unrecognized string format from DB for ExtendedDateTimeField: {value}")
-
+            return _db_string_to_cftime(value)
 
         raise TypeError(f"Unexpected type from database for ExtendedDateTimeField: {type(value)}")
 
@@ -109,75 +243,107 @@ class ExtendedDateTimeField(models.DateTimeField):
             else:
                 # Convert out-of-range standard datetime to cftime first
                 try:
-                    value = cftime.datetime(value.year, value.month, value.day,
-                                          value.hour, value.minute, value.second,
-                                          value.microsecond, calendar='standard')
+                    value = build_standard(value.year, value.month, value.day,
+                                         value.hour, value.minute, value.second,
+                                         value.microsecond)
                     # Fall through to cftime handling
                 except Exception as e:
                     raise ValidationError(f"Could not convert standard datetime {value} to cftime for DB prep: {e}")
 
         if isinstance(value, cftime.datetime):
-            cftime_year = value.year
-            bc_suffix = ""
-            display_year = cftime_year # Year used for formatting
-
-            if cftime_year <= 0:
-                 # Convert cftime year (0, -1, -2...) to positive year for BC string
-                 # Year 0 (1 BC) -> display_year 1, suffix ' BC'
-                 # Year -1 (2 BC) -> display_year 2, suffix ' BC'
-                 display_year = -(cftime_year - 1)
-                 if display_year <=0: # Sanity check
-                    raise ValueError("Calculated display year for BC cannot be zero or negative.")
-                 bc_suffix = " BC"
-            # Else (AD year), display_year remains cftime_year
+            display_year, bc_suffix = to_display_year(value.year)
 
             # Format as YYYY-MM-DD HH:MM:SS[.ffffff][ BC]
             # Ensure year is padded to at least 4 digits
-            year_str = f"{display_year:04d}"
-
-            iso_string = f"{year_str}-{value.month:02d}-{value.day:02d} {value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+            iso_string = "%04d-%02d-%02d %02d:%02d:%02d" % (display_year, value.month, value.day,
+                                                            value.hour, value.minute, value.second)
             if value.microsecond:
-                iso_string += f".{value.microsecond:06d}"
-
-            iso_string += bc_suffix # Add ' BC' if needed
-            return iso_string # Return the formatted string with BC suffix
+                iso_string += ".%06d" % value.microsecond
+            return iso_string + bc_suffix # Add ' BC' if needed
 
         raise TypeError(f"Unsupported type for ExtendedDateTimeField prep: {type(value)}")
 
 
-    def to_python(self, value):
+    def to_python(self, value, _cft=cftime.datetime, _dt=datetime.datetime, _date=datetime.date):
         """
         Converts input value (e.g., from serialization) to cftime.
-        Relies on from_db_value logic for string parsing.
+        Shares the DB string parser with from_db_value.
         """
-        if value is None:
+        handler = _TO_PYTHON_DISPATCH.get(type(value))
+        if handler is not None:
+            return handler(value)
+        # Subclasses of the dispatched types
+        if isinstance(value, _cft):
             return value
-        if isinstance(value, cftime.datetime):
-            return value
-        if isinstance(value, datetime.datetime):
-             try:
-                return cftime.datetime(value.year, value.month, value.day,
-                                       value.hour, value.minute, value.second,
-                                       value.microsecond, calendar='standard')
-             except Exception as e:
-                raise ValidationError(f"Could not convert standard datetime {value} to cftime: {e}")
-        if isinstance(value, datetime.date):
-             try:
-                return cftime.datetime(value.year, value.month, value.day, calendar='standard')
-             except Exception as e:
-                raise ValidationError(f"Could not convert standard date {value} to cftime: {e}")
-
+        if isinstance(value, _dt):
+            return _datetime_to_cftime(value)
+        if isinstance(value, _date):
+            return _date_to_cftime(value)
         if isinstance(value, str):
-             # Attempt parsing using from_db_value logic
-            try:
-                # Pass None for expression and connection as they aren't strictly needed for string parsing logic here
-                return self.from_db_value(value, None, None)
-            except ValidationError as e:
-                 raise ValidationError(f"Invalid string format for to_python ('{value}'): {e}")
+            return _string_to_cftime(value)
 
         raise ValidationError(f"Cannot convert value '{value}' (type: {type(value)}) to ExtendedDateTimeField")
 
 
+    def convert_column(self, values):
+        """
+        Converts a list of raw DB values (strings, datetimes or None) to cftime
+        objects in one pass. Used for bulk fetches that bypass from_db_value.
+        With numba installed, large batches of strings are parsed by a compiled
+        kernel first; anything it skips goes through the regular handlers.
+        """
+        from_db_value = self.from_db_value
+        get_handler = _FROM_DB_DISPATCH.get
+        converted = []
+        for value, parsed in zip(values, _parse_strings_batch(values)):
+            if parsed is not None:
+                converted.append(parsed)
+                continue
+            handler = get_handler(type(value))
+            converted.append(handler(value) if handler is not None
+                             else from_db_value(value, None, None))
+        return converted
+
+    def convert_column_arrays(self, values):
+        """
+        Converts a list of raw DB values into parallel numpy int64 arrays keyed
+        by cftime attribute name ('year', 'month', ... 'microsecond'; years in
+        cftime numbering, 0 = 1 BC), plus a boolean 'null' mask. No cftime
+        objects are kept, for aggregation code that only needs the components.
+        """
+        n = len(values)
+        arrays = {name: np.zeros(n, dtype=np.int64) for name in _COMPONENTS}
+        null = np.zeros(n, dtype=bool)
+        pending = range(n)
+
+        kernel = _batch_kernel(n)
+        if kernel is not None:
+            indices = np.array([i for i, value in enumerate(values) if type(value) is str], dtype=np.intp)
+            *fields, ok = kernel.parse_fields([values[i].strip() for i in indices])
+            # The kernel only range-checks days. Days up to 28 exist in every
+            # month, except for the October 1582 Julian/Gregorian gap; anything
+            # else goes through from_db_value so invalid dates raise as usual.
+            years, months, days = fields[:3]
+            ok &= (days <= 28) & ~((years == 1582) & (months == 10))
+            parsed = indices[ok]
+            for name, component in zip(_COMPONENTS, fields):
+                arrays[name][parsed] = component[ok]
+            done = np.zeros(n, dtype=bool)
+            done[parsed] = True
+            pending = np.flatnonzero(~done).tolist()
+
+        from_db_value = self.from_db_value
+        for i in pending:
+            value = from_db_value(values[i], None, None)
+            if value is None:
+                null[i] = True
+                continue
+            for name in _COMPONENTS:
+                arrays[name][i] = getattr(value, name)
+
+        arrays['null'] = null
+        return arrays
+
     def formfield(self, **kwargs):
         """
         Ensure the correct form field AND widget are used, overriding admin defaults.
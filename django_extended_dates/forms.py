@@ -5,6 +5,12 @@ from django.utils.translation import gettext_lazy as _
 import datetime
 import re # Need re for parsing
 
+from .utils import POW10, build_standard, to_display_year
+
+# Form input (BC suffix already stripped): YYYY-MM-DD[ HH:MM[:SS[.ffffff]]]
+# Month, day and time fields take 1 or 2 digits, as strptime's %m/%d/%H did
+_FORM_RE = re.compile(r"^(\d{1,6})-(\d{1,2})-(\d{1,2})(?:[ T](\d{1,2}):(\d{1,2})(?::(\d{1,2})(?:\.(\d{1,6}))?)?)?$")
+
 # Custom Widget (Using BC Suffix)
 class ExtendedDateTimeInput(forms.DateTimeInput):
     """
@@ -14,30 +20,22 @@ class ExtendedDateTimeInput(forms.DateTimeInput):
     """
     needs_localization = False
 
-    def format_value(self, value):
+    def format_value(self, value, _cft=cftime.datetime):
         """
         Formats cftime.datetime into 'YYYY-MM-DD HH:MM:SS[.ffffff] BC' string.
         """
-        if isinstance(value, cftime.datetime):
+        if isinstance(value, _cft):
             # Format cftime object back into a string with BC suffix
-            cftime_year = value.year
-            display_year = cftime_year
-            bc_suffix = ""
-
-            if cftime_year <= 0:
-                 # cftime year 0 (1 BC) -> display_year 1, suffix ' BC'
-                 # cftime year -1 (2 BC) -> display_year 2, suffix ' BC'
-                 display_year = -(cftime_year - 1)
-                 bc_suffix = " BC"
+            display_year, bc_suffix = to_display_year(value.year)
 
             # Format YYYY-MM-DD HH:MM:SS[.ffffff][ BC]
-            year_str = f"{display_year:04d}"
-            time_str = f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+            formatted = "%04d-%02d-%02d %02d:%02d:%02d" % (display_year, value.month, value.day,
+                                                           value.hour, value.minute, value.second)
             if value.microsecond:
-                 time_str += f".{value.microsecond:06d}"
+                 formatted += ".%06d" % value.microsecond
 
             # Directly return the fully formatted string
-            return f"{year_str}-{value.month:02d}-{value.day:02d} {time_str}{bc_suffix}"
+            return formatted + bc_suffix
 
         # If not cftime, let the parent handle formatting
         return super().format_value(value)
@@ -55,55 +53,50 @@ class ExtendedDateTimeFormField(forms.DateTimeField):
         'invalid_year_zero': _('BC year must be positive (e.g., use 1 BC, not 0 BC).'),
     }
 
-    def to_python(self, value):
+    def to_python(self, value, _cft=cftime.datetime, _dt=datetime.datetime):
         """
         Validates input can be converted to a cftime datetime.
         Returns a cftime.datetime object.
         Handles 'YYYY-MM-DD HH:MM:SS BC' format.
+        The _cft/_dt defaults bind the types as locals for the isinstance checks.
         """
         if value in self.empty_values:
             return None
-        if isinstance(value, cftime.datetime):
+        if isinstance(value, _cft):
             return value
-        if isinstance(value, datetime.datetime):
+        if isinstance(value, _dt):
              try:
                  # Standard datetime years must be AD
                 if not 1 <= value.year <= 9999:
                      raise ValidationError("Standard datetime year out of range.")
-                return cftime.datetime(value.year, value.month, value.day,
-                                       value.hour, value.minute, value.second,
-                                       value.microsecond, calendar='standard')
+                return build_standard(value.year, value.month, value.day,
+                                      value.hour, value.minute, value.second,
+                                      value.microsecond)
              except Exception as e:
                  raise ValidationError(f"Internal error converting datetime: {e}")
 
         if isinstance(value, str):
             value_str = value.strip()
             is_bc = False
-            bc_suffix = " bc" # Check case-insensitively
 
-            if value_str.lower().endswith(bc_suffix):
+            # Split off the last word to detect a ' BC' suffix (case-insensitively)
+            head, _sep, tail = value_str.rpartition(' ')
+            if tail.lower() == 'bc':
                 is_bc = True
                 # Remove the suffix for parsing
-                value_str = value_str[:-len(bc_suffix)].strip()
-
-            # Define expected formats (without BC suffix)
-            formats = [
-                '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%d %H:%M', '%Y-%m-%d',
-            ]
-            parsed_dt = None
-            for fmt in formats:
-                try:
-                    parsed_dt = datetime.datetime.strptime(value_str, fmt)
-                    break
-                except ValueError:
-                    continue
-
-            if parsed_dt is None:
+                value_str = head.rstrip()
+
+            # Expected layout (without BC suffix): YYYY-MM-DD[ HH:MM[:SS[.ffffff]]]
+            match = _FORM_RE.match(value_str)
+            if match is None:
                  raise ValidationError(self.error_messages['invalid_format'], code='invalid_format')
 
-            # Parsed year from strptime
-            parsed_year = parsed_dt.year
+            # Missing time parts come back as '0', so every component is an int
+            year_str, month_str, day_str, hour_str, minute_str, second_str, microsecond_str = match.groups('0')
+            parsed_year = int(year_str)
+            month, day = int(month_str), int(day_str)
+            hour, minute, second = int(hour_str), int(minute_str), int(second_str)
+            microsecond = int(microsecond_str) * POW10[6 - len(microsecond_str)]
 
             if parsed_year <= 0:
                  # Year before BC suffix (or without suffix) must be positive AD year
@@ -121,9 +114,8 @@ class ExtendedDateTimeFormField(forms.DateTimeField):
 
             try:
                  # Create the cftime object (timezone naive)
-                return cftime.datetime(cftime_year, parsed_dt.month, parsed_dt.day,
-                                       parsed_dt.hour, parsed_dt.minute, parsed_dt.second,
-                                       parsed_dt.microsecond, calendar='standard')
+                return build_standard(cftime_year, month, day, hour, minute, second,
+                                      microsecond)
             except Exception as e:
                 raise ValidationError(f"Error creating extended date: {e}", code='invalid')
 
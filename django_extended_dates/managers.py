@@ -0,0 +1,39 @@
+from django.db import connections, models
+from django.db.models.sql.constants import MULTI
+
+
+class ExtendedDateTimeQuerySet(models.QuerySet):
+    """
+    QuerySet with bulk helpers for ExtendedDateTimeField columns.
+    """
+
+    def extended_iterator(self, field_name, chunk_size=2000):
+        """
+        Yields the converted values of a single ExtendedDateTimeField.
+        Raw column values are pulled from the cursor and converted once per
+        fetched chunk via the field's convert_column, instead of going through
+        the per-row from_db_value callback.
+        """
+        field = self.model._meta.get_field(field_name)
+        query = self.values_list(field_name).query
+        compiler = query.get_compiler(using=self.db)
+        # Same check as QuerySet.iterator(); backends don't honour the setting themselves
+        chunked_fetch = not connections[self.db].settings_dict.get('DISABLE_SERVER_SIDE_CURSORS')
+        for rows in compiler.execute_sql(MULTI, chunked_fetch=chunked_fetch, chunk_size=chunk_size):
+            yield from field.convert_column([row[0] for row in rows])
+
+    def extended_values(self, field_name):
+        """
+        Returns a single ExtendedDateTimeField as a dict of parallel numpy
+        arrays ('year', 'month', ..., 'microsecond' and a boolean 'null'
+        mask) via the field's convert_column_arrays, without building a
+        cftime object per row.
+        """
+        field = self.model._meta.get_field(field_name)
+        query = self.values_list(field_name).query
+        compiler = query.get_compiler(using=self.db)
+        raw_values = [row[0] for rows in compiler.execute_sql(MULTI) for row in rows]
+        return field.convert_column_arrays(raw_values)
+
+
+ExtendedDateTimeManager = models.Manager.from_queryset(ExtendedDateTimeQuerySet)
@@ -0,0 +1,21 @@
+import functools
+
+import cftime
+
+# Constructor for 'standard' calendar cftime objects, used on every converted
+# row. Binding the calendar once keeps the keyword out of each call site; the
+# cftime constructor itself is already compiled, so there is no faster path
+# to hand off to without a public cftime C API.
+build_standard = functools.partial(cftime.datetime, calendar='standard')
+
+# Scale factor for a 1-6 digit fractional-seconds string, indexed by
+# 6 - len(digits): int('5') * POW10[5] == 500000 microseconds.
+POW10 = (1, 10, 100, 1000, 10000, 100000, 1000000)
+
+
+def to_display_year(cftime_year):
+    """
+    Maps a cftime year to its display year and suffix:
+    0 (1 BC) -> (1, ' BC'), -1 (2 BC) -> (2, ' BC'), 2023 -> (2023, '').
+    """
+    return (1 - cftime_year, " BC") if cftime_year <= 0 else (cftime_year, "")
@@ -1,9 +1,12 @@
 from django.db import models
 from django_extended_dates.fields import ExtendedDateTimeField
+from django_extended_dates.managers import ExtendedDateTimeManager
 
 class TestModel(models.Model):
     name = models.CharField(max_length=50)
     timestamp = ExtendedDateTimeField(null=True, blank=True)
 
+    objects = ExtendedDateTimeManager()
+
     def __str__(self):
         return self.name
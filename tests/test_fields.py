@@ -1,7 +1,10 @@
 import cftime
 import datetime
+import unittest
+from django.db import connection
 from django.test import TestCase
 from django.core.exceptions import ValidationError
+from django_extended_dates._numba_parse import HAVE_NUMBA
 from .models import TestModel
 
 class ExtendedDateTimeFieldTests(TestCase):
@@ -41,6 +44,97 @@ class ExtendedDateTimeFieldTests(TestCase):
         self.assertIsInstance(retrieved.timestamp, cftime.datetime)
         self.assertEqual(retrieved.timestamp, cftime_dt)
 
+    def test_from_db_value_bc_string(self):
+        """Test parsing Postgres 'YYYY-MM-DD HH:MM:SS[.ffffff] BC' strings."""
+        field = TestModel._meta.get_field('timestamp')
+        result = field.from_db_value('0044-03-15 10:00:00 BC', None, None)
+        self.assertEqual(result, cftime.datetime(-43, 3, 15, 10, 0, 0, calendar='standard'))
+        result = field.from_db_value('0001-01-01 00:00:00.5 bc', None, None)
+        self.assertEqual(result, cftime.datetime(0, 1, 1, 0, 0, 0, 500000, calendar='standard'))
+        for spaced in ('0044-03-15 10:00:00  BC', '0044-03-15  10:00:00 BC', '0044-03-15 10:00:00\tBC'):
+            result = field.from_db_value(spaced, None, None)
+            self.assertEqual(result, cftime.datetime(-43, 3, 15, 10, 0, 0, calendar='standard'))
+        with self.assertRaises(ValidationError):
+            field.from_db_value('0044-03-15 10:00 BC', None, None)
+        for malformed in ('12345- 1- 1  1: 1: 1', '12345-+1-01 00:00:00', '2023-W43-1 BC',
+                          '0044-03-15T10:00:00+05:00 BC', '0044-03-15 BC',
+                          '99999999999999999999-01-01 00:00:00'):
+            with self.assertRaises(ValidationError):
+                field.from_db_value(malformed, None, None)
+
+    def test_from_db_value_string_cache(self):
+        """Test that repeated DB strings are served from the parse cache."""
+        from django_extended_dates.fields import _parse_db_string
+        field = TestModel._meta.get_field('timestamp')
+        _parse_db_string.cache_clear()
+        first = field.from_db_value('0044-03-15 10:00:00 BC', None, None)
+        second = field.from_db_value(' 0044-03-15 10:00:00 BC', None, None)
+        self.assertIs(first, second)
+        self.assertEqual(_parse_db_string.cache_info().hits, 1)
+
+    def test_form_field_to_python_bc_string(self):
+        """Test the form field's to_python with BC and partial-time strings."""
+        from django_extended_dates.forms import ExtendedDateTimeFormField
+        field = ExtendedDateTimeFormField()
+        result = field.to_python("0044-03-15 10:30 BC")
+        self.assertEqual(result, cftime.datetime(-43, 3, 15, 10, 30, 0, calendar='standard'))
+        result = field.to_python("12345-01-01 00:00:00.25")
+        self.assertEqual(result, cftime.datetime(12345, 1, 1, 0, 0, 0, 250000, calendar='standard'))
+        self.assertEqual(field.to_python("2023-1-5"), cftime.datetime(2023, 1, 5, calendar='standard'))
+        result = field.to_python("2023-10-26 9:05")
+        self.assertEqual(result, cftime.datetime(2023, 10, 26, 9, 5, 0, calendar='standard'))
+        with self.assertRaises(ValidationError):
+            field.to_python("2023/10/26")
+
+    def test_extended_iterator(self):
+        """Test bulk conversion of a column through the manager's extended_iterator."""
+        # Insert with raw SQL: saving cftime values through the ORM needs the
+        # Postgres adapter, while a plain timestamp literal works on any backend
+        table = connection.ops.quote_name(TestModel._meta.db_table)
+        column = connection.ops.quote_name('timestamp')
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {table} (name, {column}) VALUES (%s, %s)",
+                           ["Test AD", "2023-10-26 12:30:15"])
+        TestModel.objects.create(name="Test None")
+        values = list(TestModel.objects.order_by('pk').extended_iterator('timestamp', chunk_size=1))
+        self.assertEqual(values, [cftime.datetime(2023, 10, 26, 12, 30, 15, calendar='standard'), None])
+
+    def test_convert_column(self):
+        """Test that convert_column matches from_db_value for each kind of DB value."""
+        field = TestModel._meta.get_field('timestamp')
+        values = ['0044-03-15 10:00:00 BC', ' 2023-10-26 12:30:15.25', datetime.datetime(2023, 10, 26, 12, 30),
+                  None, cftime.datetime(-43, 3, 15, calendar='standard')]
+        expected = [field.from_db_value(value, None, None) for value in values]
+        self.assertEqual(field.convert_column(values), expected)
+        self.assertEqual(expected[0], cftime.datetime(-43, 3, 15, 10, 0, 0, calendar='standard'))
+
+    @unittest.skipUnless(HAVE_NUMBA, "numba is not installed")
+    def test_convert_column_numba_batch(self):
+        """Test that the Numba batch path matches from_db_value, including fallbacks."""
+        field = TestModel._meta.get_field('timestamp')
+        # '2023-10-26 12:30' is valid ISO but left to the per-value parser
+        values = ['0044-03-15 10:00:00 BC', '2023-10-26 12:30:15.25', None,
+                  '2023-10-26T12:30:15', '2023-10-26 12:30',
+                  '12345-01-01', '12345-01-01T00:00:00'] * 100
+        expected = [field.from_db_value(value, None, None) for value in values]
+        self.assertEqual(field.convert_column(values), expected)
+        # Years too long for the kernel's int64 are left to the fallback
+        with self.assertRaises(ValidationError):
+            field.convert_column(['18446744073709553639-01-01 00:00:00'] * 300)
+
+    def test_convert_column_arrays(self):
+        """Test the structure-of-arrays conversion used by extended_values."""
+        field = TestModel._meta.get_field('timestamp')
+        arrays = field.convert_column_arrays(['0044-03-15 10:00:00 BC', None,
+                                              datetime.datetime(2023, 10, 26, 12, 30, 15, 250000)])
+        self.assertEqual(arrays['year'].tolist(), [-43, 0, 2023])
+        self.assertEqual(arrays['month'].tolist(), [3, 0, 10])
+        self.assertEqual(arrays['microsecond'].tolist(), [0, 0, 250000])
+        self.assertEqual(arrays['null'].tolist(), [False, True, False])
+        # Invalid dates raise whether or not the Numba kernel handles the batch
+        with self.assertRaises(ValidationError):
+            field.convert_column_arrays(['2023-02-30 00:00:00'] * 300)
+
     # ----- Tests expected to fail until implementation -----
 
     # def test_save_retrieve_cftime_bc(self):